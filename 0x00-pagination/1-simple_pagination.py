@@ -4,7 +4,8 @@ Server module for paginating a database of popular baby names.
 """
 
 import csv
-from typing import List, Tuple
+import itertools
+from typing import Iterator, List, Tuple, Union
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -26,34 +27,46 @@ class Server:
     """Server class to paginate a database of popular baby names."""
 
     DATA_FILE = "Popular_Baby_Names.csv"
+    STREAM_ROWS = 1000
 
     def __init__(self):
         self.__dataset = None
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> List[Tuple[str, ...]]:
         """Cached dataset.
 
         Returns:
-            List[List]: A list of lists containing the dataset.
+            List[Tuple[str, ...]]: A list of row tuples containing the
+            dataset.
         """
         if self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+                next(reader, None)
+                self.__dataset = list(map(tuple, reader))
 
         return self.__dataset
 
-    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+    def get_page(self, page: int = 1, page_size: int = 10,
+                 as_iter: bool = False
+                 ) -> Union[List[Tuple[str, ...]], Iterator[Tuple[str, ...]]]:
         """Get a page of the dataset.
 
+        Until the dataset is cached, a page ending within the first
+        `STREAM_ROWS` rows is read straight from the CSV without caching
+        anything. Any other page, and every `as_iter` page, loads and
+        caches the full dataset first.
+
         Args:
             page (int): The current page number. Defaults to 1.
             page_size (int): The number of items per page. Defaults to 10.
+            as_iter (bool): Return a lazy iterator over the cached rows of
+                the page instead of a new list. Defaults to False.
 
         Returns:
-            List[List]: A list of lists containing the requested page of the
-            dataset.
+            Union[List[Tuple[str, ...]], Iterator[Tuple[str, ...]]]: The row
+            tuples of the requested page, as a list, or as an iterator when
+            `as_iter` is True.
         """
         assert isinstance(page, int) and page > 0, (
             "page must be an integer greater than 0"
@@ -62,9 +75,23 @@ class Server:
             "page_size must be an integer greater than 0"
         )
 
-        start_index, end_index = index_range(page, page_size)
+        start_index = (page - 1) * page_size
+        end_index = start_index + page_size
+
+        if (self.__dataset is None and not as_iter
+                and end_index <= self.STREAM_ROWS):
+            with open(self.DATA_FILE) as f:
+                reader = csv.reader(f)
+                next(reader, None)
+                rows = itertools.islice(reader, start_index, end_index)
+                return list(map(tuple, rows))
+
         dataset = self.dataset()
 
+        if as_iter:
+            end_index = min(end_index, len(dataset))
+            return map(dataset.__getitem__, range(start_index, end_index))
+
         if start_index >= len(dataset):
             return []
 
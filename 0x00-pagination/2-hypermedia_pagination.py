@@ -31,21 +31,23 @@ class Server:
     def __init__(self):
         self.__dataset = None
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> List[Tuple[str, ...]]:
         """Cached dataset.
 
         Returns:
-            List[List]: A list of lists containing the dataset.
+            List[Tuple[str, ...]]: A list of row tuples containing the
+            dataset.
         """
         if self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+                next(reader, None)
+                self.__dataset = list(map(tuple, reader))
 
         return self.__dataset
 
-    def get_page(self, page: int = 1, page_size: int = 10) -> List[List]:
+    def get_page(self, page: int = 1,
+                 page_size: int = 10) -> List[Tuple[str, ...]]:
         """Get a page of the dataset.
 
         Args:
@@ -53,8 +55,8 @@ class Server:
             page_size (int): The number of items per page. Defaults to 10.
 
         Returns:
-            List[List]: A list of lists containing the requested page of the
-            dataset.
+            List[Tuple[str, ...]]: A list of row tuples containing the
+            requested page of the dataset.
         """
         assert isinstance(page, int) and page > 0, (
             "page must be an integer greater than 0"
@@ -63,7 +65,8 @@ class Server:
             "page_size must be an integer greater than 0"
         )
 
-        start_index, end_index = index_range(page, page_size)
+        start_index = (page - 1) * page_size
+        end_index = start_index + page_size
         dataset = self.dataset()
 
         if start_index >= len(dataset):
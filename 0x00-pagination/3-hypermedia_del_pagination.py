@@ -3,8 +3,9 @@
 Deletion-resilient hypermedia pagination
 """
 
+import bisect
 import csv
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 
 class Server:
@@ -15,19 +16,20 @@ class Server:
     def __init__(self):
         self.__dataset = None
         self.__indexed_dataset = None
+        self.__live_indices = None
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> List[Tuple[str, ...]]:
         """Cached dataset
         """
         if self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
-                dataset = [row for row in reader]
-            self.__dataset = dataset[1:]
+                next(reader, None)
+                self.__dataset = list(map(tuple, reader))
 
         return self.__dataset
 
-    def indexed_dataset(self) -> Dict[int, List]:
+    def indexed_dataset(self) -> Dict[int, Tuple[str, ...]]:
         """Dataset indexed by sorting position, starting at 0
         """
         if self.__indexed_dataset is None:
@@ -38,6 +40,31 @@ class Server:
             }
         return self.__indexed_dataset
 
+    def live_indices(self) -> List[int]:
+        """Sorted indexes still present in the indexed dataset.
+
+        Kept in sync by `delete`. Rows removed or added directly on the
+        indexed dataset are only picked up when its size changes or a
+        page hits a missing index, so use `delete` to remove rows.
+        """
+        indexed_dataset = self.indexed_dataset()
+        if (self.__live_indices is None
+                or len(self.__live_indices) != len(indexed_dataset)):
+            self.__live_indices = sorted(indexed_dataset)
+        return self.__live_indices
+
+    def delete(self, index: int) -> None:
+        """Delete a row from the indexed dataset.
+
+        Args:
+            index (int): The index of the row to delete.
+        """
+        live_indices = self.live_indices()
+        del self.indexed_dataset()[index]
+        pos = bisect.bisect_left(live_indices, index)
+        if pos < len(live_indices) and live_indices[pos] == index:
+            del live_indices[pos]
+
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
         """Get hypermedia pagination info with deletion resilience.
 
@@ -57,21 +84,26 @@ class Server:
             "page_size must be an integer greater than 0"
         )
 
-        data = []
-        next_index = index
-        current_size = 0
         indexed_dataset = self.indexed_dataset()
+        live_indices = self.live_indices()
+        dataset_size = len(self.dataset())
 
-        while current_size < page_size and next_index < len(indexed_dataset):
-            if next_index in indexed_dataset:
-                data.append(indexed_dataset[next_index])
-                current_size += 1
-            next_index += 1
+        pos = bisect.bisect_left(live_indices, index)
+        page_indices = live_indices[pos:pos + page_size]
+        if any(i not in indexed_dataset for i in page_indices):
+            # Rows were edited outside `delete`, rebuild the indexes
+            self.__live_indices = None
+            live_indices = self.live_indices()
+            pos = bisect.bisect_left(live_indices, index)
+            page_indices = live_indices[pos:pos + page_size]
+        data = [indexed_dataset[i] for i in page_indices]
+        current_size = len(data)
 
-        # Adjust next_index to handle deletions
-        while next_index < len(indexed_dataset) and \
-                next_index not in indexed_dataset:
-            next_index += 1
+        # Next index is the first row still present after this page
+        if pos + page_size < len(live_indices):
+            next_index = live_indices[pos + page_size]
+        else:
+            next_index = dataset_size
 
         return {
             "index": index,
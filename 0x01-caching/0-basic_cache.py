@@ -11,6 +11,7 @@ class BasicCache(BaseCaching):
     '''A class `BasicCache` that inherits from `BaseCaching`
        and is a caching system
     '''
+    __slots__ = ()
 
     def put(self, key, item):
         '''assign to the dictionary `self.cache_data` the
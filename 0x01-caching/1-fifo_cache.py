@@ -12,6 +12,7 @@ class FIFOCache(BaseCaching):
     '''A class `FIFOCache` that inherits from
        `BaseCaching` and is a caching system.
     '''
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -27,7 +28,7 @@ class FIFOCache(BaseCaching):
 
         if len(self.cache_data) > BaseCaching.MAX_ITEMS:
             first_key, _ = self.cache_data.popitem(last=False)
-            print(f"DISCARD: {first_key}")
+            self.print_discard(first_key)
 
         self.cache_data[key] = item
 
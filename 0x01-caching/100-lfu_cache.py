@@ -4,9 +4,31 @@ LFUCache module implements a caching system using
 the Least Frequently Used (LFU) algorithm.
 """
 
-from collections import OrderedDict, defaultdict
+from collections import OrderedDict
 from base_caching import BaseCaching
 
+_MISSING = object()
+
+
+class _FNode:
+    """
+    Bucket of keys sharing the same frequency count, linked to the
+    buckets with the next lower and higher frequency counts.
+
+    Attributes:
+        freq (int): Frequency count shared by the keys of the bucket.
+        keys (OrderedDict): Keys of the bucket, least recently used first.
+        prev (_FNode): Bucket with the next lower frequency count.
+        next (_FNode): Bucket with the next higher frequency count.
+    """
+    __slots__ = ('freq', 'keys', 'prev', 'next')
+
+    def __init__(self, freq, prev=None, next=None):
+        self.freq = freq
+        self.keys = OrderedDict()
+        self.prev = prev
+        self.next = next
+
 
 class LFUCache(BaseCaching):
     """
@@ -15,23 +37,69 @@ class LFUCache(BaseCaching):
     Args:
         BaseCaching (class): Base class with cache system interface.
     """
+    __slots__ = ('nodes', 'head')
+    _MAX_ITEMS = BaseCaching.MAX_ITEMS
+
     def __init__(self):
         """
         Initialize the cache.
 
         Attributes:
-            cache_data (OrderedDict): Dictionary to store the cache items.
-            frequency (defaultdict): Dictionary to store the frequency
-            count of items.
-            lru (defaultdict): Dictionary to store the order of insertion for
-            LRU policy within the same frequency count.
-            lru_counter (int): Counter to maintain the order of insertion.
+            cache_data (dict): Dictionary to store the cache items.
+            nodes (dict): Dictionary mapping each key to the frequency
+            bucket it currently belongs to.
+            head (_FNode): Sentinel before the bucket with the lowest
+            frequency count, buckets follow in increasing frequency.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
-        self.frequency = defaultdict(int)
-        self.lru = defaultdict(OrderedDict)
-        self.lru_counter = 0
+        self.cache_data = {}
+        self.nodes = {}
+        self.head = _FNode(0)
+
+    def _insert_after(self, node, freq):
+        """
+        Link a new empty bucket right after `node`.
+
+        Args:
+            node (_FNode): The bucket to insert after.
+            freq (int): The frequency count of the new bucket.
+
+        Returns:
+            _FNode: The new bucket.
+        """
+        new = _FNode(freq, node, node.next)
+        if node.next is not None:
+            node.next.prev = new
+        node.next = new
+        return new
+
+    def _unlink(self, node):
+        """
+        Remove an empty bucket from the list of buckets.
+
+        Args:
+            node (_FNode): The bucket to remove.
+        """
+        node.prev.next = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+
+    def _touch(self, key):
+        """
+        Move a key to the bucket with the next frequency count.
+
+        Args:
+            key (str): The key that was just used.
+        """
+        node = self.nodes[key]
+        nxt = node.next
+        if nxt is None or nxt.freq != node.freq + 1:
+            nxt = self._insert_after(node, node.freq + 1)
+        del node.keys[key]
+        nxt.keys[key] = None
+        self.nodes[key] = nxt
+        if not node.keys:
+            self._unlink(node)
 
     def put(self, key, item):
         """
@@ -51,23 +119,24 @@ class LFUCache(BaseCaching):
 
         if key in self.cache_data:
             self.cache_data[key] = item
-            self.get(key)
+            self._touch(key)
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            min_freq = min(self.frequency.values())
-            lru_key = next(iter(self.lru[min_freq]))
+        if len(self.cache_data) >= self._MAX_ITEMS:
+            first = self.head.next
+            lru_key, _ = first.keys.popitem(last=False)
+            if not first.keys:
+                self._unlink(first)
             self.cache_data.pop(lru_key)
-            self.frequency.pop(lru_key)
-            self.lru[min_freq].pop(lru_key)
-            if not self.lru[min_freq]:
-                self.lru.pop(min_freq)
-            print(f"DISCARD: {lru_key}")
+            self.nodes.pop(lru_key)
+            self.print_discard(lru_key)
 
+        first = self.head.next
+        if first is None or first.freq != 1:
+            first = self._insert_after(self.head, 1)
         self.cache_data[key] = item
-        self.frequency[key] = 1
-        self.lru[1][key] = self.lru_counter
-        self.lru_counter += 1
+        first.keys[key] = None
+        self.nodes[key] = first
 
     def get(self, key):
         """
@@ -80,17 +149,10 @@ class LFUCache(BaseCaching):
             any: The value associated with the key,
             or None if the key is not found.
         """
-        if key is None or key not in self.cache_data:
+        value = self.cache_data.get(key, _MISSING)
+        if value is _MISSING:
             return None
 
-        value = self.cache_data[key]
-
-        freq = self.frequency[key]
-        self.frequency[key] += 1
-        self.lru[freq].pop(key)
-        if not self.lru[freq]:
-            self.lru.pop(freq)
-        self.lru[freq + 1][key] = self.lru_counter
-        self.lru_counter += 1
+        self._touch(key)
 
         return value
@@ -1,8 +1,6 @@
 #!/usr/bin/env python3
 """Task 2: LIFO Caching.
 """
-from collections import OrderedDict
-
 from base_caching import BaseCaching
 
 
@@ -11,11 +9,15 @@ class LIFOCache(BaseCaching):
     retrieving items from a dictionary with a LIFO
     removal mechanism when the limit is reached.
     """
+    __slots__ = ('_last_key',)
+    _MAX_ITEMS = BaseCaching.MAX_ITEMS
+
     def __init__(self):
         """Initializes the cache.
         """
         super().__init__()
-        self.cache_data = OrderedDict()
+        self.cache_data = {}
+        self._last_key = None
 
     def put(self, key, item):
         """Adds an item in the cache.
@@ -23,11 +25,11 @@ class LIFOCache(BaseCaching):
         if key is None or item is None:
             return
         if key not in self.cache_data:
-            if len(self.cache_data) + 1 > BaseCaching.MAX_ITEMS:
-                last_key, _ = self.cache_data.popitem(True)
-                print("DISCARD:", last_key)
+            if len(self.cache_data) + 1 > self._MAX_ITEMS:
+                del self.cache_data[self._last_key]
+                self.print_discard(self._last_key)
         self.cache_data[key] = item
-        self.cache_data.move_to_end(key, last=True)
+        self._last_key = key
 
     def get(self, key):
         """Retrieves an item by key.
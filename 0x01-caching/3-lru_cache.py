@@ -11,6 +11,7 @@ class LRUCache(BaseCaching):
     '''A class `LRUCache` that inherits from
        `BaseCaching` and is a caching system
     '''
+    __slots__ = ()
 
     def __init__(self):
         '''initialize the cache
@@ -26,7 +27,7 @@ class LRUCache(BaseCaching):
         if key not in self.cache_data:
             if len(self.cache_data) + 1 > BaseCaching.MAX_ITEMS:
                 lru_key, _ = self.cache_data.popitem(True)
-                print("DISCARD:", lru_key)
+                self.print_discard(lru_key)
             self.cache_data[key] = item
             self.cache_data.move_to_end(key, last=False)
         else:
@@ -35,6 +36,6 @@ class LRUCache(BaseCaching):
     def get(self, key):
         """Retrieves an item by key.
         """
-        if key is not None and key in self.cache_data:
+        if key in self.cache_data:
             self.cache_data.move_to_end(key, last=False)
         return self.cache_data.get(key, None)
@@ -2,9 +2,10 @@
 """_summary_
 """
 
-from collections import OrderedDict
 from base_caching import BaseCaching
 
+_MISSING = object()
+
 
 class MRUCache(BaseCaching):
     """_summary_
@@ -12,9 +13,13 @@ class MRUCache(BaseCaching):
     Args:
         BaseCaching (_type_): _description_
     """
+    __slots__ = ('_last_key',)
+    _MAX_ITEMS = BaseCaching.MAX_ITEMS
+
     def __init__(self):
         super().__init__()
-        self.cache_data = OrderedDict()
+        self.cache_data = {}
+        self._last_key = None
 
     def put(self, key, item):
         """_summary_
@@ -25,13 +30,13 @@ class MRUCache(BaseCaching):
         """
         if key is None or item is None:
             return
-        if key in self.cache_data:
-            self.cache_data.move_to_end(key)
-        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            discard = self.cache_data.popitem()
-            print(f"DISCARD: {discard[0]}")
+        if (key not in self.cache_data
+                and len(self.cache_data) >= self._MAX_ITEMS):
+            del self.cache_data[self._last_key]
+            self.print_discard(self._last_key)
 
         self.cache_data[key] = item
+        self._last_key = key
 
     def get(self, key):
         """_summary_
@@ -42,7 +47,8 @@ class MRUCache(BaseCaching):
         Returns:
             _type_: _description_
         """
-        if key not in self.cache_data or key is None:
+        value = self.cache_data.get(key, _MISSING)
+        if value is _MISSING:
             return None
-        self.cache_data.move_to_end(key)
-        return self.cache_data[key]
+        self._last_key = key
+        return value
@@ -7,7 +7,9 @@ class BaseCaching():
       - constants of your caching system
       - where your data are stored (in a dictionary)
     """
+    __slots__ = ('cache_data',)
     MAX_ITEMS = 4
+    VERBOSE = True
 
     def __init__(self):
         """ Initiliaze
@@ -21,6 +23,12 @@ class BaseCaching():
         for key in sorted(self.cache_data.keys()):
             print("{}: {}".format(key, self.cache_data.get(key)))
 
+    def print_discard(self, key):
+        """ Print a discarded key, unless VERBOSE is turned off
+        """
+        if self.VERBOSE:
+            print("DISCARD: {}".format(key))
+
     def put(self, key, item):
         """ Add an item in the cache
         """